@@ -4,9 +4,11 @@
 """DeitTiny model implementation."""
 from __future__ import annotations
 
+from copy import deepcopy
+from functools import lru_cache
+from itertools import islice
 from typing import TYPE_CHECKING, Any, Callable
 
-import numpy as np
 import torch
 from mmpretrain.models.utils import resize_pos_embed
 
@@ -28,16 +30,62 @@ if TYPE_CHECKING:
     from lightning.pytorch.cli import LRSchedulerCallable, OptimizerCallable
     from mmpretrain.models.classifiers import ImageClassifier
     from mmpretrain.structures import DataSample
+    from omegaconf import DictConfig
 
     from otx.core.metrics import MetricCallable
 
 
+@lru_cache(maxsize=None)
+def _read_deit_tiny_mmconfig(subdir_name: str) -> DictConfig:
+    """Reads the DeiT-tiny MMConfig of the given task only once, callers should work on a copy of it."""
+    return read_mmconfig("deit_tiny", subdir_name=subdir_name)
+
+
 class ForwardExplainMixInForDeit(ExplainableMixInMMPretrainModel):
     """Deit model which can attach a XAI (Explainable AI) branch."""
 
     @torch.no_grad()
     def head_forward_fn(self, x: torch.Tensor) -> torch.Tensor:
-        """Performs model's neck and head forward."""
+        """Performs model's neck and head forward.
+
+        Runs under inference mode, which is cheaper than no_grad, except during export tracing
+        since the tracer needs to track version counters of the intermediate tensors.
+        """
+        target_layer, final_norm, neck, head = self._get_explain_head_modules()
+
+        with torch.inference_mode(mode=not torch.jit.is_tracing()):
+            # Part of the last transformer_encoder block (except first LayerNorm)
+            x = x + target_layer.attn(x)
+            x = target_layer.ffn(target_layer.norm2(x), identity=x)
+
+            # Final LayerNorm and neck
+            if final_norm is not None:
+                x = final_norm(x)
+            if neck is not None:
+                x = neck(x)
+
+            # Head
+            cls_token = x[:, 0]
+            layer_output = [None, cls_token]
+            logit = head.forward(layer_output)
+            if isinstance(logit, list):
+                # Stack on-device instead of going through numpy, which forces a host sync per call
+                if isinstance(logit[0], torch.Tensor):
+                    logit = torch.stack(logit)
+                else:
+                    logit = torch.as_tensor(logit, device=x.device)
+            return logit
+
+    def _get_explain_head_modules(self) -> tuple:
+        """Returns the submodules used by head_forward_fn, resolving them on first use."""
+        # Kept as a plain tuple so that the submodules are not registered twice
+        modules = self.__dict__.get("_explain_head_modules")
+        if modules is None:
+            modules = self._resolve_explain_head_modules()
+        return modules
+
+    def _resolve_explain_head_modules(self) -> tuple:
+        """Validates the model structure and stores the submodules used by head_forward_fn."""
         if not hasattr(self.model.backbone, "layers"):
             raise ValueError
         if not hasattr(self.model.backbone, "final_norm"):
@@ -45,24 +93,13 @@ class ForwardExplainMixInForDeit(ExplainableMixInMMPretrainModel):
         if not hasattr(self.model, "with_neck"):
             raise ValueError
 
-        # Part of the last transformer_encoder block (except first LayerNorm)
-        target_layer = self.model.backbone.layers[-1]
-        x = x + target_layer.attn(x)
-        x = target_layer.ffn(target_layer.norm2(x), identity=x)
-
-        # Final LayerNorm and neck
-        if self.model.backbone.final_norm:
-            x = self.model.backbone.norm1(x)
-        if self.model.with_neck:
-            x = self.model.neck(x)
-
-        # Head
-        cls_token = x[:, 0]
-        layer_output = [None, cls_token]
-        logit = self.model.head.forward(layer_output)
-        if isinstance(logit, list):
-            logit = torch.from_numpy(np.array(logit))
-        return logit
+        self._explain_head_modules = (
+            self.model.backbone.layers[-1],
+            self.model.backbone.norm1 if self.model.backbone.final_norm else None,
+            self.model.neck if self.model.with_neck else None,
+            self.model.head,
+        )
+        return self._explain_head_modules
 
     @staticmethod
     def _forward_explain_image_classifier(
@@ -82,30 +119,45 @@ class ForwardExplainMixInForDeit(ExplainableMixInMMPretrainModel):
             cls_token = backbone.cls_token.expand(batch_size, -1, -1)
             x = torch.cat((cls_token, x), dim=1)
 
-        x = x + resize_pos_embed(
-            backbone.pos_embed,
-            backbone.patch_resolution,
-            patch_resolution,
-            mode=backbone.interpolate_mode,
-            num_extra_tokens=backbone.num_extra_tokens,
-        )
-        x = backbone.drop_after_pos(x)
+        # resize_pos_embed is a no-op at the trained resolution, so skip the call altogether
+        if tuple(patch_resolution) == tuple(backbone.patch_resolution):
+            pos_embed = backbone.pos_embed
+        else:
+            pos_embed = resize_pos_embed(
+                backbone.pos_embed,
+                backbone.patch_resolution,
+                patch_resolution,
+                mode=backbone.interpolate_mode,
+                num_extra_tokens=backbone.num_extra_tokens,
+            )
+        if torch.is_grad_enabled() or torch.jit.is_tracing() or torch.result_type(x, pos_embed) != x.dtype:
+            x = x + pos_embed
+        else:
+            # x is a freshly allocated activation here, so it can be updated in-place
+            x.add_(pos_embed)
+        if backbone.training:
+            # Dropout is an identity in eval mode
+            x = backbone.drop_after_pos(x)
 
         x = backbone.pre_norm(x)
 
         outs = []
-        layernorm_feat = None
-        for i, layer in enumerate(backbone.layers):
-            if i == len(backbone.layers) - 1:
-                layernorm_feat = layer.norm1(x)
-
+        out_indices = set(backbone.out_indices)
+        last_idx = len(backbone.layers) - 1
+        format_output = backbone._format_output  # noqa: SLF001
+        for i, layer in enumerate(islice(backbone.layers, last_idx)):
             x = layer(x)
-
-            if i == len(backbone.layers) - 1 and backbone.final_norm:
-                x = backbone.ln1(x)
-
-            if i in backbone.out_indices:
-                outs.append(backbone._format_output(x, patch_resolution))  # noqa: SLF001
+            if i in out_indices:
+                outs.append(format_output(x, patch_resolution))
+
+        # The last layer is unrolled, since its first LayerNorm output is the target of the explain algorithm
+        last_layer = backbone.layers[-1]
+        layernorm_feat = last_layer.norm1(x)
+        x = last_layer(x)
+        if backbone.final_norm:
+            x = backbone.ln1(x)
+        if last_idx in out_indices:
+            outs.append(format_output(x, patch_resolution))
 
         x = tuple(outs)
         ### End of backbone forward
@@ -133,6 +185,8 @@ class ForwardExplainMixInForDeit(ExplainableMixInMMPretrainModel):
 
     def get_explain_fn(self) -> Callable:
         """Returns explain function."""
+        # Validate the model structure once here instead of on every head_forward_fn call
+        self._resolve_explain_head_modules()
         explainer = ViTReciproCAM(
             self.head_forward_fn,
             num_classes=self.num_classes,
@@ -144,6 +198,10 @@ class ForwardExplainMixInForDeit(ExplainableMixInMMPretrainModel):
         """PTQ config for DeitTinyForMultilabelCls."""
         return {"model_type": "transformer"}
 
+    def load_from_otx_v1_ckpt(self, state_dict: dict, add_prefix: str = "model.model.") -> dict:
+        """Load the previous OTX ckpt according to OTX2.0."""
+        return OTXv1Helper.load_cls_effnet_b0_ckpt(state_dict, "multiclass", add_prefix)
+
 
 class DeitTinyForHLabelCls(ForwardExplainMixInForDeit, MMPretrainHlabelClsModel):
     """DeitTiny Model for hierarchical label classification task."""
@@ -156,7 +214,7 @@ class DeitTinyForHLabelCls(ForwardExplainMixInForDeit, MMPretrainHlabelClsModel)
         metric: MetricCallable = HLabelClsMetricCallble,
         torch_compile: bool = False,
     ) -> None:
-        config = read_mmconfig("deit_tiny", subdir_name="hlabel_classification")
+        config = deepcopy(_read_deit_tiny_mmconfig("hlabel_classification"))
 
         super().__init__(
             label_info=label_info,
@@ -167,10 +225,6 @@ class DeitTinyForHLabelCls(ForwardExplainMixInForDeit, MMPretrainHlabelClsModel)
             torch_compile=torch_compile,
         )
 
-    def load_from_otx_v1_ckpt(self, state_dict: dict, add_prefix: str = "model.model.") -> dict:
-        """Load the previous OTX ckpt according to OTX2.0."""
-        return OTXv1Helper.load_cls_effnet_b0_ckpt(state_dict, "multiclass", add_prefix)
-
 
 class DeitTinyForMulticlassCls(ForwardExplainMixInForDeit, MMPretrainMulticlassClsModel):
     """DeitTiny Model for multi-label classification task."""
@@ -183,7 +237,7 @@ class DeitTinyForMulticlassCls(ForwardExplainMixInForDeit, MMPretrainMulticlassC
         metric: MetricCallable = MultiClassClsMetricCallable,
         torch_compile: bool = False,
     ) -> None:
-        config = read_mmconfig("deit_tiny", subdir_name="multiclass_classification")
+        config = deepcopy(_read_deit_tiny_mmconfig("multiclass_classification"))
         super().__init__(
             label_info=label_info,
             config=config,
@@ -193,10 +247,6 @@ class DeitTinyForMulticlassCls(ForwardExplainMixInForDeit, MMPretrainMulticlassC
             torch_compile=torch_compile,
         )
 
-    def load_from_otx_v1_ckpt(self, state_dict: dict, add_prefix: str = "model.model.") -> dict:
-        """Load the previous OTX ckpt according to OTX2.0."""
-        return OTXv1Helper.load_cls_effnet_b0_ckpt(state_dict, "multiclass", add_prefix)
-
 
 class DeitTinyForMultilabelCls(ForwardExplainMixInForDeit, MMPretrainMultilabelClsModel):
     """DeitTiny Model for multi-class classification task."""
@@ -209,7 +259,7 @@ class DeitTinyForMultilabelCls(ForwardExplainMixInForDeit, MMPretrainMultilabelC
         metric: MetricCallable = MultiLabelClsMetricCallable,
         torch_compile: bool = False,
     ) -> None:
-        config = read_mmconfig("deit_tiny", subdir_name="multilabel_classification")
+        config = deepcopy(_read_deit_tiny_mmconfig("multilabel_classification"))
         super().__init__(
             label_info=label_info,
             config=config,
@@ -218,7 +268,3 @@ class DeitTinyForMultilabelCls(ForwardExplainMixInForDeit, MMPretrainMultilabelC
             metric=metric,
             torch_compile=torch_compile,
         )
-
-    def load_from_otx_v1_ckpt(self, state_dict: dict, add_prefix: str = "model.model.") -> dict:
-        """Load the previous OTX ckpt according to OTX2.0."""
-        return OTXv1Helper.load_cls_effnet_b0_ckpt(state_dict, "multiclass", add_prefix)
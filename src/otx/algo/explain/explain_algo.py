@@ -211,38 +211,32 @@ class ViTReciproCAM(BaseExplainAlgo):
         token_number, dim = feature_map.size()
         mosaic_feature_map = torch.zeros(token_number - 1, token_number, dim).to(feature_map.device)
         h = w = int((token_number - 1) ** 0.5)
+        # One-hot spatial masks for all tokens at once, i.e. k-th mask is non-zero only at the k-th token
+        spacial_masks = torch.eye(h * w, device=feature_map.device)
 
         if self._use_gaussian:
             if self._cls_token:
                 mosaic_feature_map[:, 0, :] = feature_map[0, :]
             feature_map_spacial = feature_map[1:, :].reshape(1, h, w, dim)
-            feature_map_spacial_repeated = feature_map_spacial.repeat(h * w, 1, 1, 1)  # 196, 14, 14, 192
 
-            spacial_order = torch.arange(h * w).reshape(h, w)
             gaussian = torch.tensor(
                 [[1 / 16.0, 1 / 8.0, 1 / 16.0], [1 / 8.0, 1 / 4.0, 1 / 8.0], [1 / 16.0, 1 / 8.0, 1 / 16.0]],
             ).to(feature_map.device)
-            mosaic_feature_map_mask_padded = torch.zeros(h * w, h + 2, w + 2).to(feature_map.device)
-            for i in range(h):
-                for j in range(w):
-                    k = spacial_order[i, j]
-                    i_pad = i + 1
-                    j_pad = j + 1
-                    mosaic_feature_map_mask_padded[k, i_pad - 1 : i_pad + 2, j_pad - 1 : j_pad + 2] = gaussian
-            mosaic_feature_map_mask = mosaic_feature_map_mask_padded[:, 1:-1, 1:-1]
-            mosaic_feature_map_mask = torch.tensor(mosaic_feature_map_mask.unsqueeze(3).repeat(1, 1, 1, dim))
-
-            mosaic_fm_wo_cls_token = feature_map_spacial_repeated * mosaic_feature_map_mask
+            # Spread every one-hot mask with the (symmetric) gaussian kernel in a single conv call
+            mosaic_feature_map_mask = torch.nn.functional.conv2d(
+                spacial_masks.reshape(h * w, 1, h, w),
+                gaussian.reshape(1, 1, 3, 3),
+                padding=1,
+            ).reshape(h * w, h, w, 1)
+
+            mosaic_fm_wo_cls_token = feature_map_spacial * mosaic_feature_map_mask  # 196, 14, 14, 192
             mosaic_feature_map[:, 1:, :] = mosaic_fm_wo_cls_token.reshape(h * w, h * w, dim)
         else:
-            feature_map_repeated = feature_map.unsqueeze(0).repeat(h * w, 1, 1)
             mosaic_feature_map_mask = torch.zeros(h * w, token_number).to(feature_map.device)
-            for i in range(h * w):
-                mosaic_feature_map_mask[i, i + 1] = torch.ones(1).to(feature_map.device)
+            mosaic_feature_map_mask[:, 1:] = spacial_masks
             if self._cls_token:
-                mosaic_feature_map_mask[:, 0] = torch.ones(1).to(feature_map.device)
-            mosaic_feature_map_mask = torch.tensor(mosaic_feature_map_mask.unsqueeze(2).repeat(1, 1, dim))
-            mosaic_feature_map = feature_map_repeated * mosaic_feature_map_mask
+                mosaic_feature_map_mask[:, 0] = 1.0
+            mosaic_feature_map = feature_map.unsqueeze(0) * mosaic_feature_map_mask.unsqueeze(2)
 
         return mosaic_feature_map
 
@@ -5,7 +5,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Literal
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Iterable, Literal
 
 from torch.onnx import OperatorExportTypes
 
@@ -26,19 +27,148 @@ if TYPE_CHECKING:
     from otx.core.metrics import MetricCallable
 
 
+class LiteHRNetVariant(str, Enum):
+    """LiteHRNet model variant."""
+
+    LITEHRNET_18 = "litehrnet_18"
+    LITEHRNET_S = "litehrnet_s"
+    LITEHRNET_X = "litehrnet_x"
+
+
+def _stage_module_ignored_names(stage: int, module: int, num_branches: int) -> tuple[str, ...]:
+    """Returns the ONNX node names excluded from PTQ in a LiteHRNet stage module.
+
+    Those are the cross resolution weighting Mul nodes of both blocks, one per branch,
+    and the fuse layer Add nodes summing up the branches, e.g. `Add_1`, `Add_2` and `Add_5` for 3 branches.
+    """
+    prefix = f"/model/backbone/stage{stage}/stage{stage}.{module}"
+    names = []
+    for block in range(2):
+        weighting = f"{prefix}/layers/layers.{block}/cross_resolution_weighting"
+        names.append(f"{weighting}/Mul")
+        names.extend(f"{weighting}/Mul_{idx}" for idx in range(1, num_branches))
+    # The i-th fuse layer output accumulates (num_branches - 1 - i) Adds, numbered in (num_branches + 1) strides
+    for i in range(num_branches - 1):
+        start = 1 + i * (num_branches + 1)
+        names.extend(f"{prefix}/Add_{idx}" for idx in range(start, start + num_branches - 1 - i))
+    return tuple(names)
+
+
+def _stage_ignored_names(stage: int, modules: Iterable[int]) -> tuple[str, ...]:
+    """Returns the ONNX node names excluded from PTQ in the given modules of a LiteHRNet stage.
+
+    The i-th stage of every LiteHRNet variant has (i + 2) branches.
+    """
+    return tuple(name for module in modules for name in _stage_module_ignored_names(stage, module, stage + 2))
+
+
+# Stage modules which are common for several LiteHRNet variants
+_STAGE0_IGNORED_NAMES = _stage_ignored_names(0, range(2))
+_STAGE1_IGNORED_NAMES = _stage_ignored_names(1, range(4))
+_STAGE2_IGNORED_NAMES = _stage_ignored_names(2, range(2))
+
+_AGGREGATOR_IGNORED_NAMES = ("/model/aggregator/Add", "/model/aggregator/Add_1")
+
+# Names of the ONNX nodes excluded from PTQ for each LiteHRNet variant
+_IGNORED_SCOPE_NAMES: dict[LiteHRNetVariant, tuple[str, ...]] = {
+    LiteHRNetVariant.LITEHRNET_18: (
+        *_STAGE0_IGNORED_NAMES,
+        *_STAGE1_IGNORED_NAMES,
+        *_STAGE2_IGNORED_NAMES,
+        *_AGGREGATOR_IGNORED_NAMES,
+        "/model/aggregator/Add_2",
+        "/model/backbone/stage2/stage2.1/Add",
+    ),
+    LiteHRNetVariant.LITEHRNET_S: (
+        *_STAGE0_IGNORED_NAMES,
+        *_stage_ignored_names(0, range(2, 4)),
+        *_STAGE1_IGNORED_NAMES,
+        *_AGGREGATOR_IGNORED_NAMES,
+    ),
+    LiteHRNetVariant.LITEHRNET_X: (
+        *_STAGE0_IGNORED_NAMES,
+        *_STAGE1_IGNORED_NAMES,
+        *_STAGE2_IGNORED_NAMES,
+        *_stage_ignored_names(2, range(2, 4)),
+        *_stage_ignored_names(3, range(2)),
+        *(
+            f"/model/backbone/stage{stage}/stage{stage}.{module}/Add"
+            for stage, num_modules in enumerate((2, 4, 4, 2))
+            for module in range(num_modules)
+        ),
+    ),
+}
+
+
+def _advanced_parameters(quantile_outlier_prob: float = 1e-4) -> dict[str, Any]:
+    """Returns PTQ advanced parameters estimating activation ranges by quantiles instead of min/max."""
+    return {
+        "activations_range_estimator_params": {
+            aggregator_type.lower(): {
+                "statistics_type": "QUANTILE",
+                "aggregator_type": aggregator_type,
+                "quantile_outlier_prob": quantile_outlier_prob,
+            }
+            for aggregator_type in ("MIN", "MAX")
+        },
+    }
+
+
+# Variant specific part of the PTQ config, built once at import and holding only immutable values
+_PTQ_CONFIGS: dict[LiteHRNetVariant, dict[str, Any]] = {
+    LiteHRNetVariant.LITEHRNET_18: {
+        "quantile_outlier_prob": 1e-4,
+        "ignored_scope": {
+            "patterns": ("/model/backbone/*",),
+            "names": _IGNORED_SCOPE_NAMES[LiteHRNetVariant.LITEHRNET_18],
+        },
+        "preset": "mixed",
+    },
+    LiteHRNetVariant.LITEHRNET_S: {
+        "quantile_outlier_prob": 1e-4,
+        "ignored_scope": {
+            "names": _IGNORED_SCOPE_NAMES[LiteHRNetVariant.LITEHRNET_S],
+        },
+        "preset": "mixed",
+    },
+    LiteHRNetVariant.LITEHRNET_X: {
+        "quantile_outlier_prob": 1e-4,
+        "ignored_scope": {
+            "patterns": ("/model/aggregator/*",),
+            "names": _IGNORED_SCOPE_NAMES[LiteHRNetVariant.LITEHRNET_X],
+        },
+        "preset": "performance",
+    },
+}
+
+
+def _build_ptq_config(variant: LiteHRNetVariant) -> dict[str, Any]:
+    """Returns a fresh PTQ config of the given variant.
+
+    Only the dicts are rebuilt, the ignored scope patterns and names are shared immutable tuples.
+    """
+    variant_config = _PTQ_CONFIGS[variant]
+    return {
+        "advanced_parameters": _advanced_parameters(quantile_outlier_prob=variant_config["quantile_outlier_prob"]),
+        "ignored_scope": {**variant_config["ignored_scope"]},
+        "preset": variant_config["preset"],
+    }
+
+
 class LiteHRNet(MMSegCompatibleModel):
     """LiteHRNet Model."""
 
     def __init__(
         self,
         label_info: LabelInfoTypes,
-        variant: Literal["18", 18, "s", "x"],
+        variant: LiteHRNetVariant | Literal["18", 18, "s", "x"],
         optimizer: OptimizerCallable = DefaultOptimizerCallable,
         scheduler: LRSchedulerCallable | LRSchedulerListCallable = DefaultSchedulerCallable,
         metric: MetricCallable = SegmCallable,  # type: ignore[assignment]
         torch_compile: bool = False,
     ) -> None:
-        self.model_name = f"litehrnet_{variant}"
+        self._variant = variant if isinstance(variant, LiteHRNetVariant) else LiteHRNetVariant(f"litehrnet_{variant}")
+        self.model_name = self._variant.value
         config = read_mmconfig(model_name=self.model_name)
         super().__init__(
             label_info=label_info,
@@ -75,343 +205,4 @@ class LiteHRNet(MMSegCompatibleModel):
     def _optimization_config(self) -> dict[str, Any]:
         """PTQ config for LiteHRNet."""
         # TODO(Kirill): check PTQ without adding the whole backbone to ignored_scope
-        ignored_scope = self._obtain_ignored_scope()
-        optim_config = {
-            "advanced_parameters": {
-                "activations_range_estimator_params": {
-                    "min": {"statistics_type": "QUANTILE", "aggregator_type": "MIN", "quantile_outlier_prob": 1e-4},
-                    "max": {"statistics_type": "QUANTILE", "aggregator_type": "MAX", "quantile_outlier_prob": 1e-4},
-                },
-            },
-        }
-        optim_config.update(ignored_scope)
-        return optim_config
-
-    def _obtain_ignored_scope(self) -> dict[str, Any]:
-        """Returns the ignored scope for the model based on the litehrnet version."""
-        if self.model_name == "litehrnet_18":
-            ignored_scope_names = [
-                "/model/backbone/stage0/stage0.0/layers/layers.0/cross_resolution_weighting/Mul",
-                "/model/backbone/stage0/stage0.0/layers/layers.0/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage0/stage0.0/layers/layers.1/cross_resolution_weighting/Mul",
-                "/model/backbone/stage0/stage0.0/layers/layers.1/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage0/stage0.0/Add_1",
-                "/model/backbone/stage0/stage0.1/layers/layers.0/cross_resolution_weighting/Mul",
-                "/model/backbone/stage0/stage0.1/layers/layers.0/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage0/stage0.1/layers/layers.1/cross_resolution_weighting/Mul",
-                "/model/backbone/stage0/stage0.1/layers/layers.1/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage0/stage0.1/Add_1",
-                "/model/backbone/stage1/stage1.0/layers/layers.0/cross_resolution_weighting/Mul",
-                "/model/backbone/stage1/stage1.0/layers/layers.0/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage1/stage1.0/layers/layers.0/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage1/stage1.0/layers/layers.1/cross_resolution_weighting/Mul",
-                "/model/backbone/stage1/stage1.0/layers/layers.1/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage1/stage1.0/Add_1",
-                "/model/backbone/stage1/stage1.0/layers/layers.1/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage1/stage1.0/Add_2",
-                "/model/backbone/stage1/stage1.0/Add_5",
-                "/model/backbone/stage1/stage1.1/layers/layers.0/cross_resolution_weighting/Mul",
-                "/model/backbone/stage1/stage1.1/layers/layers.0/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage1/stage1.1/layers/layers.0/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage1/stage1.1/layers/layers.1/cross_resolution_weighting/Mul",
-                "/model/backbone/stage1/stage1.1/layers/layers.1/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage1/stage1.1/Add_1",
-                "/model/backbone/stage1/stage1.1/layers/layers.1/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage1/stage1.1/Add_2",
-                "/model/backbone/stage1/stage1.1/Add_5",
-                "/model/backbone/stage1/stage1.2/layers/layers.0/cross_resolution_weighting/Mul",
-                "/model/backbone/stage1/stage1.2/layers/layers.0/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage1/stage1.2/layers/layers.0/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage1/stage1.2/layers/layers.1/cross_resolution_weighting/Mul",
-                "/model/backbone/stage1/stage1.2/layers/layers.1/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage1/stage1.2/Add_1",
-                "/model/backbone/stage1/stage1.2/layers/layers.1/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage1/stage1.2/Add_2",
-                "/model/backbone/stage1/stage1.2/Add_5",
-                "/model/backbone/stage1/stage1.3/layers/layers.0/cross_resolution_weighting/Mul",
-                "/model/backbone/stage1/stage1.3/layers/layers.0/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage1/stage1.3/layers/layers.0/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage1/stage1.3/layers/layers.1/cross_resolution_weighting/Mul",
-                "/model/backbone/stage1/stage1.3/layers/layers.1/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage1/stage1.3/Add_1",
-                "/model/backbone/stage1/stage1.3/layers/layers.1/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage1/stage1.3/Add_2",
-                "/model/backbone/stage1/stage1.3/Add_5",
-                "/model/backbone/stage2/stage2.0/layers/layers.0/cross_resolution_weighting/Mul",
-                "/model/backbone/stage2/stage2.0/layers/layers.0/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage2/stage2.0/layers/layers.0/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage2/stage2.0/layers/layers.0/cross_resolution_weighting/Mul_3",
-                "/model/backbone/stage2/stage2.0/layers/layers.1/cross_resolution_weighting/Mul",
-                "/model/backbone/stage2/stage2.0/layers/layers.1/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage2/stage2.0/Add_1",
-                "/model/backbone/stage2/stage2.0/layers/layers.1/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage2/stage2.0/Add_2",
-                "/model/backbone/stage2/stage2.0/layers/layers.1/cross_resolution_weighting/Mul_3",
-                "/model/backbone/stage2/stage2.0/Add_3",
-                "/model/backbone/stage2/stage2.0/Add_6",
-                "/model/backbone/stage2/stage2.0/Add_7",
-                "/model/backbone/stage2/stage2.0/Add_11",
-                "/model/backbone/stage2/stage2.1/layers/layers.0/cross_resolution_weighting/Mul",
-                "/model/backbone/stage2/stage2.1/layers/layers.0/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage2/stage2.1/layers/layers.0/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage2/stage2.1/layers/layers.0/cross_resolution_weighting/Mul_3",
-                "/model/backbone/stage2/stage2.1/layers/layers.1/cross_resolution_weighting/Mul",
-                "/model/backbone/stage2/stage2.1/layers/layers.1/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage2/stage2.1/Add_1",
-                "/model/backbone/stage2/stage2.1/layers/layers.1/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage2/stage2.1/Add_2",
-                "/model/backbone/stage2/stage2.1/layers/layers.1/cross_resolution_weighting/Mul_3",
-                "/model/backbone/stage2/stage2.1/Add_3",
-                "/model/backbone/stage2/stage2.1/Add_6",
-                "/model/backbone/stage2/stage2.1/Add_7",
-                "/model/backbone/stage2/stage2.1/Add_11",
-                "/model/aggregator/Add",
-                "/model/aggregator/Add_1",
-                "/model/aggregator/Add_2",
-                "/model/backbone/stage2/stage2.1/Add",
-            ]
-
-            return {
-                "ignored_scope": {
-                    "patterns": ["/model/backbone/*"],
-                    "names": ignored_scope_names,
-                },
-                "preset": "mixed",
-            }
-
-        if self.model_name == "litehrnet_s":
-            ignored_scope_names = [
-                "/model/backbone/stage0/stage0.0/layers/layers.0/cross_resolution_weighting/Mul",
-                "/model/backbone/stage0/stage0.0/layers/layers.0/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage0/stage0.0/layers/layers.1/cross_resolution_weighting/Mul",
-                "/model/backbone/stage0/stage0.0/layers/layers.1/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage0/stage0.0/Add_1",
-                "/model/backbone/stage0/stage0.1/layers/layers.0/cross_resolution_weighting/Mul",
-                "/model/backbone/stage0/stage0.1/layers/layers.0/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage0/stage0.1/layers/layers.1/cross_resolution_weighting/Mul",
-                "/model/backbone/stage0/stage0.1/layers/layers.1/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage0/stage0.1/Add_1",
-                "/model/backbone/stage0/stage0.2/layers/layers.0/cross_resolution_weighting/Mul",
-                "/model/backbone/stage0/stage0.2/layers/layers.0/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage0/stage0.2/layers/layers.1/cross_resolution_weighting/Mul",
-                "/model/backbone/stage0/stage0.2/layers/layers.1/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage0/stage0.2/Add_1",
-                "/model/backbone/stage0/stage0.3/layers/layers.0/cross_resolution_weighting/Mul",
-                "/model/backbone/stage0/stage0.3/layers/layers.0/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage0/stage0.3/layers/layers.1/cross_resolution_weighting/Mul",
-                "/model/backbone/stage0/stage0.3/layers/layers.1/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage0/stage0.3/Add_1",
-                "/model/backbone/stage1/stage1.0/layers/layers.0/cross_resolution_weighting/Mul",
-                "/model/backbone/stage1/stage1.0/layers/layers.0/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage1/stage1.0/layers/layers.0/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage1/stage1.0/layers/layers.1/cross_resolution_weighting/Mul",
-                "/model/backbone/stage1/stage1.0/layers/layers.1/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage1/stage1.0/Add_1",
-                "/model/backbone/stage1/stage1.0/layers/layers.1/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage1/stage1.0/Add_2",
-                "/model/backbone/stage1/stage1.0/Add_5",
-                "/model/backbone/stage1/stage1.1/layers/layers.0/cross_resolution_weighting/Mul",
-                "/model/backbone/stage1/stage1.1/layers/layers.0/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage1/stage1.1/layers/layers.0/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage1/stage1.1/layers/layers.1/cross_resolution_weighting/Mul",
-                "/model/backbone/stage1/stage1.1/layers/layers.1/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage1/stage1.1/Add_1",
-                "/model/backbone/stage1/stage1.1/layers/layers.1/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage1/stage1.1/Add_2",
-                "/model/backbone/stage1/stage1.1/Add_5",
-                "/model/backbone/stage1/stage1.2/layers/layers.0/cross_resolution_weighting/Mul",
-                "/model/backbone/stage1/stage1.2/layers/layers.0/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage1/stage1.2/layers/layers.0/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage1/stage1.2/layers/layers.1/cross_resolution_weighting/Mul",
-                "/model/backbone/stage1/stage1.2/layers/layers.1/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage1/stage1.2/Add_1",
-                "/model/backbone/stage1/stage1.2/layers/layers.1/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage1/stage1.2/Add_2",
-                "/model/backbone/stage1/stage1.2/Add_5",
-                "/model/backbone/stage1/stage1.3/layers/layers.0/cross_resolution_weighting/Mul",
-                "/model/backbone/stage1/stage1.3/layers/layers.0/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage1/stage1.3/layers/layers.0/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage1/stage1.3/layers/layers.1/cross_resolution_weighting/Mul",
-                "/model/backbone/stage1/stage1.3/layers/layers.1/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage1/stage1.3/Add_1",
-                "/model/backbone/stage1/stage1.3/layers/layers.1/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage1/stage1.3/Add_2",
-                "/model/backbone/stage1/stage1.3/Add_5",
-                "/model/aggregator/Add",
-                "/model/aggregator/Add_1",
-            ]
-
-            return {
-                "ignored_scope": {
-                    "names": ignored_scope_names,
-                },
-                "preset": "mixed",
-            }
-
-        if self.model_name == "litehrnet_x":
-            ignored_scope_names = [
-                "/model/backbone/stage0/stage0.0/layers/layers.0/cross_resolution_weighting/Mul",
-                "/model/backbone/stage0/stage0.0/layers/layers.0/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage0/stage0.0/layers/layers.1/cross_resolution_weighting/Mul",
-                "/model/backbone/stage0/stage0.0/layers/layers.1/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage0/stage0.0/Add_1",
-                "/model/backbone/stage0/stage0.1/layers/layers.0/cross_resolution_weighting/Mul",
-                "/model/backbone/stage0/stage0.1/layers/layers.0/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage0/stage0.1/layers/layers.1/cross_resolution_weighting/Mul",
-                "/model/backbone/stage0/stage0.1/layers/layers.1/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage0/stage0.1/Add_1",
-                "/model/backbone/stage1/stage1.0/layers/layers.0/cross_resolution_weighting/Mul",
-                "/model/backbone/stage1/stage1.0/layers/layers.0/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage1/stage1.0/layers/layers.0/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage1/stage1.0/layers/layers.1/cross_resolution_weighting/Mul",
-                "/model/backbone/stage1/stage1.0/layers/layers.1/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage1/stage1.0/Add_1",
-                "/model/backbone/stage1/stage1.0/layers/layers.1/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage1/stage1.0/Add_2",
-                "/model/backbone/stage1/stage1.0/Add_5",
-                "/model/backbone/stage1/stage1.1/layers/layers.0/cross_resolution_weighting/Mul",
-                "/model/backbone/stage1/stage1.1/layers/layers.0/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage1/stage1.1/layers/layers.0/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage1/stage1.1/layers/layers.1/cross_resolution_weighting/Mul",
-                "/model/backbone/stage1/stage1.1/layers/layers.1/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage1/stage1.1/Add_1",
-                "/model/backbone/stage1/stage1.1/layers/layers.1/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage1/stage1.1/Add_2",
-                "/model/backbone/stage1/stage1.1/Add_5",
-                "/model/backbone/stage1/stage1.2/layers/layers.0/cross_resolution_weighting/Mul",
-                "/model/backbone/stage1/stage1.2/layers/layers.0/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage1/stage1.2/layers/layers.0/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage1/stage1.2/layers/layers.1/cross_resolution_weighting/Mul",
-                "/model/backbone/stage1/stage1.2/layers/layers.1/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage1/stage1.2/Add_1",
-                "/model/backbone/stage1/stage1.2/layers/layers.1/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage1/stage1.2/Add_2",
-                "/model/backbone/stage1/stage1.2/Add_5",
-                "/model/backbone/stage1/stage1.3/layers/layers.0/cross_resolution_weighting/Mul",
-                "/model/backbone/stage1/stage1.3/layers/layers.0/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage1/stage1.3/layers/layers.0/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage1/stage1.3/layers/layers.1/cross_resolution_weighting/Mul",
-                "/model/backbone/stage1/stage1.3/layers/layers.1/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage1/stage1.3/Add_1",
-                "/model/backbone/stage1/stage1.3/layers/layers.1/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage1/stage1.3/Add_2",
-                "/model/backbone/stage1/stage1.3/Add_5",
-                "/model/backbone/stage2/stage2.0/layers/layers.0/cross_resolution_weighting/Mul",
-                "/model/backbone/stage2/stage2.0/layers/layers.0/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage2/stage2.0/layers/layers.0/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage2/stage2.0/layers/layers.0/cross_resolution_weighting/Mul_3",
-                "/model/backbone/stage2/stage2.0/layers/layers.1/cross_resolution_weighting/Mul",
-                "/model/backbone/stage2/stage2.0/layers/layers.1/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage2/stage2.0/Add_1",
-                "/model/backbone/stage2/stage2.0/layers/layers.1/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage2/stage2.0/Add_2",
-                "/model/backbone/stage2/stage2.0/layers/layers.1/cross_resolution_weighting/Mul_3",
-                "/model/backbone/stage2/stage2.0/Add_3",
-                "/model/backbone/stage2/stage2.0/Add_6",
-                "/model/backbone/stage2/stage2.0/Add_7",
-                "/model/backbone/stage2/stage2.0/Add_11",
-                "/model/backbone/stage2/stage2.1/layers/layers.0/cross_resolution_weighting/Mul",
-                "/model/backbone/stage2/stage2.1/layers/layers.0/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage2/stage2.1/layers/layers.0/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage2/stage2.1/layers/layers.0/cross_resolution_weighting/Mul_3",
-                "/model/backbone/stage2/stage2.1/layers/layers.1/cross_resolution_weighting/Mul",
-                "/model/backbone/stage2/stage2.1/layers/layers.1/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage2/stage2.1/Add_1",
-                "/model/backbone/stage2/stage2.1/layers/layers.1/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage2/stage2.1/Add_2",
-                "/model/backbone/stage2/stage2.1/layers/layers.1/cross_resolution_weighting/Mul_3",
-                "/model/backbone/stage2/stage2.1/Add_3",
-                "/model/backbone/stage2/stage2.1/Add_6",
-                "/model/backbone/stage2/stage2.1/Add_7",
-                "/model/backbone/stage2/stage2.1/Add_11",
-                "/model/backbone/stage2/stage2.2/layers/layers.0/cross_resolution_weighting/Mul",
-                "/model/backbone/stage2/stage2.2/layers/layers.0/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage2/stage2.2/layers/layers.0/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage2/stage2.2/layers/layers.0/cross_resolution_weighting/Mul_3",
-                "/model/backbone/stage2/stage2.2/layers/layers.1/cross_resolution_weighting/Mul",
-                "/model/backbone/stage2/stage2.2/layers/layers.1/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage2/stage2.2/Add_1",
-                "/model/backbone/stage2/stage2.2/layers/layers.1/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage2/stage2.2/Add_2",
-                "/model/backbone/stage2/stage2.2/layers/layers.1/cross_resolution_weighting/Mul_3",
-                "/model/backbone/stage2/stage2.2/Add_3",
-                "/model/backbone/stage2/stage2.2/Add_6",
-                "/model/backbone/stage2/stage2.2/Add_7",
-                "/model/backbone/stage2/stage2.2/Add_11",
-                "/model/backbone/stage2/stage2.3/layers/layers.0/cross_resolution_weighting/Mul",
-                "/model/backbone/stage2/stage2.3/layers/layers.0/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage2/stage2.3/layers/layers.0/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage2/stage2.3/layers/layers.0/cross_resolution_weighting/Mul_3",
-                "/model/backbone/stage2/stage2.3/layers/layers.1/cross_resolution_weighting/Mul",
-                "/model/backbone/stage2/stage2.3/layers/layers.1/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage2/stage2.3/Add_1",
-                "/model/backbone/stage2/stage2.3/layers/layers.1/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage2/stage2.3/Add_2",
-                "/model/backbone/stage2/stage2.3/layers/layers.1/cross_resolution_weighting/Mul_3",
-                "/model/backbone/stage2/stage2.3/Add_3",
-                "/model/backbone/stage2/stage2.3/Add_6",
-                "/model/backbone/stage2/stage2.3/Add_7",
-                "/model/backbone/stage2/stage2.3/Add_11",
-                "/model/backbone/stage3/stage3.0/layers/layers.0/cross_resolution_weighting/Mul",
-                "/model/backbone/stage3/stage3.0/layers/layers.0/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage3/stage3.0/layers/layers.0/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage3/stage3.0/layers/layers.0/cross_resolution_weighting/Mul_3",
-                "/model/backbone/stage3/stage3.0/layers/layers.0/cross_resolution_weighting/Mul_4",
-                "/model/backbone/stage3/stage3.0/layers/layers.1/cross_resolution_weighting/Mul",
-                "/model/backbone/stage3/stage3.0/layers/layers.1/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage3/stage3.0/Add_1",
-                "/model/backbone/stage3/stage3.0/layers/layers.1/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage3/stage3.0/Add_2",
-                "/model/backbone/stage3/stage3.0/layers/layers.1/cross_resolution_weighting/Mul_3",
-                "/model/backbone/stage3/stage3.0/Add_3",
-                "/model/backbone/stage3/stage3.0/layers/layers.1/cross_resolution_weighting/Mul_4",
-                "/model/backbone/stage3/stage3.0/Add_4",
-                "/model/backbone/stage3/stage3.0/Add_7",
-                "/model/backbone/stage3/stage3.0/Add_8",
-                "/model/backbone/stage3/stage3.0/Add_9",
-                "/model/backbone/stage3/stage3.0/Add_13",
-                "/model/backbone/stage3/stage3.0/Add_14",
-                "/model/backbone/stage3/stage3.0/Add_19",
-                "/model/backbone/stage3/stage3.1/layers/layers.0/cross_resolution_weighting/Mul",
-                "/model/backbone/stage3/stage3.1/layers/layers.0/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage3/stage3.1/layers/layers.0/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage3/stage3.1/layers/layers.0/cross_resolution_weighting/Mul_3",
-                "/model/backbone/stage3/stage3.1/layers/layers.0/cross_resolution_weighting/Mul_4",
-                "/model/backbone/stage3/stage3.1/layers/layers.1/cross_resolution_weighting/Mul",
-                "/model/backbone/stage3/stage3.1/layers/layers.1/cross_resolution_weighting/Mul_1",
-                "/model/backbone/stage3/stage3.1/Add_1",
-                "/model/backbone/stage3/stage3.1/layers/layers.1/cross_resolution_weighting/Mul_2",
-                "/model/backbone/stage3/stage3.1/Add_2",
-                "/model/backbone/stage3/stage3.1/layers/layers.1/cross_resolution_weighting/Mul_3",
-                "/model/backbone/stage3/stage3.1/Add_3",
-                "/model/backbone/stage3/stage3.1/layers/layers.1/cross_resolution_weighting/Mul_4",
-                "/model/backbone/stage3/stage3.1/Add_4",
-                "/model/backbone/stage3/stage3.1/Add_7",
-                "/model/backbone/stage3/stage3.1/Add_8",
-                "/model/backbone/stage3/stage3.1/Add_9",
-                "/model/backbone/stage3/stage3.1/Add_13",
-                "/model/backbone/stage3/stage3.1/Add_14",
-                "/model/backbone/stage3/stage3.1/Add_19",
-                "/model/backbone/stage0/stage0.0/Add",
-                "/model/backbone/stage0/stage0.1/Add",
-                "/model/backbone/stage1/stage1.0/Add",
-                "/model/backbone/stage1/stage1.1/Add",
-                "/model/backbone/stage1/stage1.2/Add",
-                "/model/backbone/stage1/stage1.3/Add",
-                "/model/backbone/stage2/stage2.0/Add",
-                "/model/backbone/stage2/stage2.1/Add",
-                "/model/backbone/stage2/stage2.2/Add",
-                "/model/backbone/stage2/stage2.3/Add",
-                "/model/backbone/stage3/stage3.0/Add",
-                "/model/backbone/stage3/stage3.1/Add",
-            ]
-
-            return {
-                "ignored_scope": {
-                    "patterns": ["/model/aggregator/*"],
-                    "names": ignored_scope_names,
-                },
-                "preset": "performance",
-            }
-
-        return {}
+        return _build_ptq_config(self._variant)
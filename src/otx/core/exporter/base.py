@@ -311,6 +311,11 @@ class OTXModelExporter:
 
         return exported_model
 
+    @staticmethod
+    def _needs_onnx_postprocess(embed_metadata: bool, precision: OTXPrecisionType) -> bool:
+        """Returns whether _postprocess_onnx_model would change the ONNX model with the given arguments."""
+        return embed_metadata or precision == OTXPrecisionType.FP16
+
     def _postprocess_onnx_model(
         self,
         onnx_model: onnx.ModelProto,
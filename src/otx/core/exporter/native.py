@@ -121,10 +121,11 @@ class OTXNativeModelExporter(OTXModelExporter):
 
         torch.onnx.export(model, dummy_tensor, save_path, **self.onnx_export_configuration)
 
-        onnx_model = onnx.load(save_path)
-        onnx_model = self._postprocess_onnx_model(onnx_model, embed_metadata, precision)
-
-        onnx.save(onnx_model, save_path)
+        # Skip the redundant protobuf load/save round-trip when post-processing is a no-op (e.g. the `via_onnx` path)
+        if self._needs_onnx_postprocess(embed_metadata, precision):
+            onnx_model = onnx.load(save_path)
+            onnx_model = self._postprocess_onnx_model(onnx_model, embed_metadata, precision)
+            onnx.save(onnx_model, save_path)
         log.info("Converting to ONNX is done.")
 
         return Path(save_path)
@@ -5,6 +5,7 @@
 from pathlib import Path
 
 import pytest
+import torch
 from otx.algo.classification.deit_tiny import (
     DeitTinyForHLabelCls,
     DeitTinyForMulticlassCls,
@@ -68,3 +69,25 @@ class TestDeitTiny:
             export_format=OTXExportFormatType.OPENVINO,
             precision=OTXPrecisionType.FP16,
         )
+
+    def test_forward_explain_inference_mode(self, fxt_model_and_input):
+        fxt_model, fxt_input = fxt_model_and_input
+        fxt_model.eval()
+        fxt_model.explain_mode = True
+
+        # Inference mode takes the in-place position embedding add path
+        with torch.inference_mode():
+            preds_inference = fxt_model.forward_explain(fxt_input)
+        with torch.enable_grad():
+            preds_grad = fxt_model.forward_explain(fxt_input)
+
+        assert torch.allclose(
+            torch.stack(preds_inference.scores).float(),
+            torch.stack(preds_grad.scores).detach().float(),
+            atol=1e-5,
+        )
+        assert torch.allclose(
+            torch.stack(preds_inference.saliency_map).float(),
+            torch.stack(preds_grad.saliency_map).float(),
+            atol=1.0,
+        )
@@ -1,5 +1,6 @@
 # Copyright (C) 2024 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
+import pytest
 import torch
 from datumaro import Polygon
 from otx.algo.explain.explain_algo import (
@@ -64,6 +65,65 @@ def test_vitreciprocam() -> None:
     assert saliency_maps.size() == torch.Size([1, 2, 14, 14])
 
 
+def _loop_built_vit_mosaic_feature_map(
+    feature_map: torch.Tensor,
+    use_gaussian: bool,
+    cls_token: bool,
+) -> torch.Tensor:
+    """Reference ViTReciproCAM mosaic feature map built token by token."""
+    token_number, dim = feature_map.size()
+    h = w = int((token_number - 1) ** 0.5)
+    mosaic_feature_map = torch.zeros(h * w, token_number, dim)
+    gaussian = torch.tensor(
+        [[1 / 16.0, 1 / 8.0, 1 / 16.0], [1 / 8.0, 1 / 4.0, 1 / 8.0], [1 / 16.0, 1 / 8.0, 1 / 16.0]],
+    )
+    for i in range(h):
+        for j in range(w):
+            k = i * w + j
+            if cls_token:
+                mosaic_feature_map[k, 0] = feature_map[0]
+            if use_gaussian:
+                mask_padded = torch.zeros(h + 2, w + 2)
+                mask_padded[i : i + 3, j : j + 3] = gaussian
+                mask = mask_padded[1:-1, 1:-1].reshape(h * w, 1)
+                mosaic_feature_map[k, 1:] = feature_map[1:] * mask
+            else:
+                mosaic_feature_map[k, k + 1] = feature_map[k + 1]
+    return mosaic_feature_map
+
+
+@pytest.mark.parametrize("use_gaussian", [True, False])
+@pytest.mark.parametrize("cls_token", [True, False])
+def test_vitreciprocam_mosaic_feature_map(use_gaussian: bool, cls_token: bool) -> None:
+    explain_algo = ViTReciproCAM(
+        lambda x: x,
+        num_classes=2,
+        use_gaussian=use_gaussian,
+        cls_token=cls_token,
+    )
+
+    feature_map = torch.rand((26, 8))
+    mosaic_feature_map = explain_algo._get_mosaic_feature_map(feature_map)
+    assert mosaic_feature_map.size() == torch.Size([25, 26, 8])
+    assert torch.allclose(
+        mosaic_feature_map,
+        _loop_built_vit_mosaic_feature_map(feature_map, use_gaussian, cls_token),
+    )
+
+    def token(i: int, j: int) -> int:
+        return 1 + i * 5 + j
+
+    # Mosaic of the center token on the 5x5 grid: edge neighbour, corner neighbour and a distant token
+    center = token(2, 2) - 1
+    edge_weight, corner_weight = (0.125, 0.0625) if use_gaussian else (0.0, 0.0)
+    assert torch.allclose(mosaic_feature_map[center, token(2, 3)], feature_map[token(2, 3)] * edge_weight)
+    assert torch.allclose(mosaic_feature_map[center, token(3, 3)], feature_map[token(3, 3)] * corner_weight)
+    assert torch.all(mosaic_feature_map[center, token(0, 0)] == 0)
+    # Mosaic of the top-left token is cropped at the boundary instead of wrapping around
+    assert torch.all(mosaic_feature_map[0, token(0, 4)] == 0)
+    assert torch.all(mosaic_feature_map[0, token(4, 4)] == 0)
+
+
 def test_detclassprob() -> None:
     num_classes = 2
     num_anchors = [1] * 10
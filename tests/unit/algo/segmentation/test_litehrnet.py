@@ -0,0 +1,75 @@
+# Copyright (C) 2024 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+
+import json
+
+import pytest
+from otx.algo.segmentation.litehrnet import LiteHRNet, LiteHRNetVariant, _stage_module_ignored_names
+from otx.algo.utils.support_otx_v1 import OTXv1Helper
+
+
+class TestLiteHRNet:
+    @pytest.fixture(params=["18", "s", "x"])
+    def fxt_litehrnet(self, request) -> LiteHRNet:
+        return LiteHRNet(10, request.param)
+
+    def test_litehrnet_init(self, fxt_litehrnet):
+        assert isinstance(fxt_litehrnet, LiteHRNet)
+        assert fxt_litehrnet.num_classes == 10
+
+    def test_litehrnet_variant(self):
+        model = LiteHRNet(10, 18)
+        assert model._variant is LiteHRNetVariant.LITEHRNET_18
+        assert model.model_name == "litehrnet_18"
+        assert f"{model.model_name}" == "litehrnet_18"
+
+        model = LiteHRNet(10, LiteHRNetVariant.LITEHRNET_S)
+        assert model._variant is LiteHRNetVariant.LITEHRNET_S
+        assert model.model_name == "litehrnet_s"
+        with pytest.raises(ValueError, match="litehrnet_m"):
+            LiteHRNet(10, "m")
+
+    def test_load_from_otx_v1_ckpt(self, fxt_litehrnet, mocker):
+        mock_load_ckpt = mocker.patch.object(OTXv1Helper, "load_seg_lite_hrnet_ckpt")
+        fxt_litehrnet.load_from_otx_v1_ckpt({})
+        mock_load_ckpt.assert_called_once_with({}, "model.model.")
+
+    def test_optimization_config(self, fxt_litehrnet):
+        config = fxt_litehrnet._optimization_config
+        assert isinstance(config, dict)
+        assert "advanced_parameters" in config
+        assert "ignored_scope" in config
+        assert len(config["ignored_scope"]["names"]) > 0
+        assert config["preset"] in ("mixed", "performance")
+
+        # The config is serialized into the exported model metadata and callers get their own copy of it
+        json.dumps(config)
+        config["preset"] = "changed"
+        config["ignored_scope"]["names"] = []
+        config["ignored_scope"]["patterns"] = ["changed"]
+        config["advanced_parameters"]["activations_range_estimator_params"]["min"]["quantile_outlier_prob"] = 0.5
+
+        fresh_config = fxt_litehrnet._optimization_config
+        assert fresh_config["preset"] != "changed"
+        assert len(fresh_config["ignored_scope"]["names"]) > 0
+        assert "changed" not in fresh_config["ignored_scope"].get("patterns", [])
+        assert fresh_config["advanced_parameters"]["activations_range_estimator_params"]["min"][
+            "quantile_outlier_prob"
+        ] == pytest.approx(1e-4)
+
+
+@pytest.mark.parametrize(
+    ("num_branches", "expected_adds"),
+    [(2, [1]), (3, [1, 2, 5]), (4, [1, 2, 3, 6, 7, 11]), (5, [1, 2, 3, 4, 7, 8, 9, 13, 14, 19])],
+)
+def test_stage_module_ignored_names(num_branches, expected_adds):
+    names = _stage_module_ignored_names(1, 0, num_branches)
+    prefix = "/model/backbone/stage1/stage1.0"
+
+    muls = [name for name in names if "cross_resolution_weighting" in name]
+    assert len(muls) == 2 * num_branches
+    assert f"{prefix}/layers/layers.1/cross_resolution_weighting/Mul_{num_branches - 1}" in muls
+
+    adds = [name for name in names if name not in muls]
+    assert adds == [f"{prefix}/Add_{idx}" for idx in expected_adds]
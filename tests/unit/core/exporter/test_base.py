@@ -95,3 +95,15 @@ class TestOTXModelExporter:
             exporter._embed_onnx_metadata.assert_called_once()
             convert_float_to_float16_mock.assert_called_once_with(onnx_model)
             assert result is onnx_model
+
+    @pytest.mark.parametrize(
+        ("embed_metadata", "precision", "expected"),
+        [
+            (False, OTXPrecisionType.FP32, False),
+            (True, OTXPrecisionType.FP32, True),
+            (False, OTXPrecisionType.FP16, True),
+            (True, OTXPrecisionType.FP16, True),
+        ],
+    )
+    def test_needs_onnx_postprocess(self, exporter, embed_metadata, precision, expected):
+        assert exporter._needs_onnx_postprocess(embed_metadata, precision) == expected
@@ -73,3 +73,19 @@ class TestOTXNativeModelExporter:
         # Load the model to verify it's a valid ONNX file
         onnx_model = onnx.load(str(exported_path))
         onnx.checker.check_model(onnx_model)
+
+    def test_to_onnx_export_skips_noop_postprocess(self, exporter, dummy_model, tmp_path, mocker):
+        output_dir = tmp_path / "onnx_export"
+        output_dir.mkdir()
+        mock_postprocess = mocker.patch.object(exporter, "_postprocess_onnx_model")
+
+        exported_path = exporter.to_onnx(
+            model=dummy_model,
+            output_dir=output_dir,
+            base_model_name="test_onnx_model",
+            precision=OTXPrecisionType.FP32,
+            embed_metadata=False,
+        )
+
+        assert exported_path.exists()
+        mock_postprocess.assert_not_called()